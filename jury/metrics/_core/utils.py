@@ -1,11 +1,15 @@
+import hashlib
 import importlib.util
 import os
+import shutil
+import tarfile
 import warnings
 from pathlib import Path
-from typing import Callable, Sequence, Union
+from typing import Callable, Dict, Optional, Sequence, Union
 
 import numpy as np
 import requests
+from filelock import FileLock
 
 PACKAGE_CORE = Path(os.path.abspath(os.path.dirname(__file__)))
 METRICS_ROOT = PACKAGE_CORE.parent
@@ -46,6 +50,97 @@ def download(source: str, destination: str, overwrite: bool = False, warn: bool
         out_file.write(r.content)
 
 
+class _HashingReader:
+    """File-like wrapper updating a sha256 digest with every chunk read from the underlying stream."""
+
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.sha256 = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.fileobj.read(size)
+        self.sha256.update(chunk)
+        return chunk
+
+
+def _safe_tar_members(tar: tarfile.TarFile, destination: str):
+    """
+    Yields the members of a tar archive which are extracted inside destination, skipping members with paths
+    or link targets pointing outside of it (e.g. absolute paths or paths containing '..').
+    """
+    base = os.path.realpath(os.path.abspath(destination))
+
+    def is_outside(path: str, parent: str) -> bool:
+        resolved = os.path.realpath(os.path.abspath(os.path.join(parent, path)))
+        return resolved != base and not resolved.startswith(base + os.sep)
+
+    for member in tar:
+        if is_outside(member.name, base):
+            reason = "illegal path"
+        elif member.issym() and is_outside(member.linkname, os.path.join(base, os.path.dirname(member.name))):
+            reason = "symlink pointing outside of the destination"
+        elif member.islnk() and is_outside(member.linkname, base):
+            reason = "hard link pointing outside of the destination"
+        else:
+            yield member
+            continue
+        warnings.warn(f"Skipping extraction of '{member.name}' from the archive: {reason}.")
+
+
+def download_and_extract_tar(
+    source: str,
+    destination: str,
+    sha256: Optional[str] = None,
+    timeout: float = 100.0,
+    proxies: Optional[Dict[str, str]] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> None:
+    """
+    Downloads a tar archive and extracts it into destination while the bytes are being received, without
+    storing the archive on disk. Nothing is done if destination already exists. Members with paths or links
+    pointing outside of destination are not extracted. Concurrent calls for the same destination are
+    serialized with a file lock.
+
+    Args:
+        source: (``str``) URL of the tar archive.
+        destination: (``str``) Directory to extract the archive into.
+        sha256: (``str``) Optional expected sha256 hex digest of the archive, computed on the fly.
+        timeout: (``float``) Seconds to wait for the server to respond or to send the next bytes.
+        proxies: (``Dict[str, str]``) Optional proxies passed to `requests`.
+        headers: (``Dict[str, str]``) Optional HTTP headers passed to `requests`.
+    """
+    if os.path.exists(destination):
+        return
+    os.makedirs(os.path.dirname(os.path.abspath(destination)), exist_ok=True)
+    with FileLock(destination + ".lock"):
+        # Another process may have completed the extraction while waiting for the lock.
+        if os.path.exists(destination):
+            return
+        incomplete_destination = destination + ".incomplete"
+        shutil.rmtree(incomplete_destination, ignore_errors=True)
+
+        with requests.get(
+            source, allow_redirects=True, stream=True, timeout=timeout, proxies=proxies, headers=headers
+        ) as r:
+            r.raise_for_status()
+            r.raw.decode_content = True
+            reader = _HashingReader(r.raw)
+            with tarfile.open(fileobj=reader, mode="r|*") as tar:
+                members = _safe_tar_members(tar, incomplete_destination)
+                if hasattr(tarfile, "data_filter"):
+                    tar.extractall(incomplete_destination, members=members, filter="data")
+                else:
+                    tar.extractall(incomplete_destination, members=members)
+            # Consume the trailing bytes (end of archive blocks) for the digest to cover the whole file.
+            while reader.read(1024 * 1024):
+                pass
+
+        if sha256 is not None and reader.sha256.hexdigest() != sha256:
+            shutil.rmtree(incomplete_destination, ignore_errors=True)
+            raise ValueError(f"Checksum of the archive downloaded from {source} does not match the expected sha256.")
+        os.rename(incomplete_destination, destination)
+
+
 def import_module(module_name: str, filepath: str):
     spec = importlib.util.spec_from_file_location(module_name, filepath)
     module = importlib.util.module_from_spec(spec)
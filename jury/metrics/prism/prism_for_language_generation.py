@@ -17,14 +17,30 @@ Prism metric. The part of this file is adapted from metric implementations
 of datasets package. See
 https://github.com/huggingface/datasets/blob/master/metrics/
 """
+import functools
+import glob
 import os
-from typing import Callable, Dict, List, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import datasets
+import numpy as np
 import validators
+from datasets.utils.file_utils import get_datasets_user_agent, hash_url_to_filename
 
+from jury.collator import Collator
 from jury.metrics import LanguageGenerationInstance
 from jury.metrics._core import MetricForLanguageGeneration
+from jury.metrics._core.utils import download_and_extract_tar
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+logger = datasets.logging.get_logger(__name__)
 
 _CITATION = """
 @inproceedings{thompson-post-2020-automatic,
@@ -55,6 +71,16 @@ Construction Args:
     lang (str): Language of the sentences; required (e.g. 'en').
     temperature (float): Softmax temperature, where values >1.0 produce more uniform samples 
         and values <1.0 produce sharper samples.
+    jit (bool): If True, the NMT model is compiled with `torch.compile` (torch>=2.0) on load, falls back to
+        eager mode if compilation fails. Disabled by default.
+    device (str): Device to run the NMT model on (e.g. 'cpu', 'cuda', 'cuda:1'). By default, 'cuda' is used
+        if available, 'cpu' otherwise.
+    dtype (str): Floating point type to cast the NMT model to (e.g. 'bfloat16', 'float16') on CUDA devices,
+        inference is also run under autocast with this type. It is ignored on other devices. By default, the
+        model is kept in float32.
+    devices (list of int): CUDA device indices to run replicas of the NMT model on, the inputs are sharded
+        across the replicas and scored concurrently. Takes precedence over `device` if CUDA is available,
+        indices must be unique.
     
 Computation Args:
     predictions (list of str): Prediction/candidate sentences.
@@ -129,9 +155,64 @@ CHECKPOINT_URLS = {
     }
 }
 
+# NaN-aware counterparts of common reduce functions, used to reduce NaN-padded score groups at once.
+_NAN_REDUCE_FNS = {
+    np.mean: np.nanmean,
+    np.max: np.nanmax,
+    np.min: np.nanmin,
+    np.median: np.nanmedian,
+    np.sum: np.nansum,
+}
+
+if njit is not None:
+    # Optional numba kernels for large segment score arrays, see `PrismForLanguageGeneration._NUMBA_MIN_SIZE`.
+
+    @njit(fastmath=True, parallel=True)
+    def _pow_vec(base, arr):
+        out = np.empty_like(arr)
+        for i in prange(arr.size):
+            out[i] = base ** arr[i]
+        return out
+
+    # fastmath is not used here as it assumes no NaNs, which are used as padding.
+    @njit(parallel=True)
+    def _nanmean_rows(arr):
+        out = np.empty(arr.shape[0])
+        for i in prange(arr.shape[0]):
+            total = 0.0
+            count = 0
+            for j in range(arr.shape[1]):
+                if not np.isnan(arr[i, j]):
+                    total += arr[i, j]
+                    count += 1
+            out[i] = total / count
+        return out
+
+    @functools.lru_cache(maxsize=None)
+    def _warm_up_kernels():
+        # Compiled once on the first scorer load rather than on import, as jury imports all metrics eagerly.
+        _pow_vec(2.0, np.zeros(1))
+        _nanmean_rows(np.zeros((1, 1)))
+
 
 @datasets.utils.file_utils.add_start_docstrings(_DESCRIPTION, _KWARGS_DESCRIPTION)
 class PrismForLanguageGeneration(MetricForLanguageGeneration):
+    # Scorers shared across instances, keyed by (model_dir, lang, temperature, jit, device, dtype).
+    _SCORER_POOL: Dict[Tuple, Any] = {}
+    # Minimum number of scores for numba kernels to be used (if numba is installed) instead of numpy.
+    _NUMBA_MIN_SIZE = 1024
+    # Scorer calls on CUDA are made in micro-batches of adaptive size, the size grows by a factor of
+    # _BATCH_SIZE_GROWTH after every _BATCH_SIZE_GROWTH_INTERVAL successful batches up to _MAX_BATCH_SIZE,
+    # and it is halved on CUDA out of memory errors.
+    _INITIAL_BATCH_SIZE = 32
+    _MAX_BATCH_SIZE = 1024
+    _BATCH_SIZE_GROWTH = 1.25
+    _BATCH_SIZE_GROWTH_INTERVAL = 8
+    # Maximum number of sentences whose tokenization is cached per scorer.
+    _TOKENIZATION_CACHE_SIZE = 100_000
+    # Maximum number of (prediction, reference) pairs whose scores are cached per metric.
+    _SCORE_CACHE_SIZE = 100_000
+
     def __init__(
         self,
         resulting_name: str = None,
@@ -139,19 +220,39 @@ class PrismForLanguageGeneration(MetricForLanguageGeneration):
         model_path_or_url: str = "default",
         lang: str = "en",
         temperature: float = 1.0,
+        jit: bool = False,
+        device: Optional[str] = None,
+        dtype: Optional[str] = None,
+        devices: Optional[List[int]] = None,
         **kwargs,
     ):
         self.model_path_or_url = model_path_or_url
         self.lang = lang
         self.temperature = temperature
+        self.jit = jit
+        self.device = device
+        self.dtype = dtype
+        if devices is not None and len(set(devices)) != len(devices):
+            raise ValueError(f"'devices' must contain unique CUDA device indices, got {devices}.")
+        self.devices = devices
         self.model_dir = None
         self.scorer = None
+        self._replicas = []
+        self._cached_identifier = None
+        self._score_cache: Dict[Tuple[str, str], float] = OrderedDict()
+        self._batch_size = self._INITIAL_BATCH_SIZE
+        self._successful_batches = 0
         super().__init__(resulting_name=resulting_name, compute_kwargs=compute_kwargs, **kwargs)
 
     @property
     def model_identifier(self):
-        if self.scorer is not None:
-            return self.scorer.identifier()
+        if self.scorer is None:
+            return None
+        # Identifier is cached along with the scorer it belongs to, and is refreshed if the scorer is replaced.
+        if self._cached_identifier is None or self._cached_identifier[0] is not self.scorer:
+            self._cached_identifier = (self.scorer, self.scorer.identifier())
+        # A copy is returned, so that mutating a result's identifier does not affect other results.
+        return dict(self._cached_identifier[1])
 
     def _download_model(self, dl_manager):
         if (
@@ -169,23 +270,64 @@ class PrismForLanguageGeneration(MetricForLanguageGeneration):
             else:
                 model_source = self.model_path_or_url
                 model_dir = os.path.basename(self.model_path_or_url).replace(".tar", "")
-            extraction_dir = dl_manager.download_and_extract(model_source)
+            extraction_dir = self._download_and_extract_model(dl_manager, model_source)
             self.model_dir = os.path.join(extraction_dir, model_dir)
 
+    @staticmethod
+    def _download_and_extract_model(dl_manager, model_source: str) -> str:
+        """
+        Streams the model archive from HTTP(S) sources into the download manager's cache directory, extracting
+        it while the bytes arrive. The download manager is used instead for other sources, in offline mode, and
+        if the archive has already been downloaded by it, so that its cached extraction is reused.
+        """
+        download_config = dl_manager.download_config
+        cache_dir = download_config.cache_dir or datasets.config.DOWNLOADED_DATASETS_PATH
+        url_hash = hash_url_to_filename(model_source)
+        extraction_dir = os.path.join(cache_dir, "extracted", url_hash)
+        if os.path.isdir(extraction_dir):
+            return extraction_dir
+
+        cached_archives = [
+            path
+            for path in glob.glob(os.path.join(cache_dir, url_hash + "*"))
+            if not path.endswith((".json", ".lock", ".incomplete"))
+        ]
+        if (
+            not model_source.startswith(("http://", "https://"))
+            or datasets.config.HF_DATASETS_OFFLINE
+            or cached_archives
+        ):
+            return dl_manager.download_and_extract(model_source)
+
+        download_and_extract_tar(
+            model_source,
+            extraction_dir,
+            proxies=download_config.proxies,
+            headers={"user-agent": get_datasets_user_agent(download_config.user_agent)},
+        )
+        return extraction_dir
+
     def _download_and_prepare(self, dl_manager) -> None:
         """
         Downloads and import the computation of Prism score from the implementation
         of Prism computation from thompsonb/prism. The code is sourced from a specific
         commit on the master branch, in order to keep things stable. See
         https://github.com/thompsonb/prism/blob/42e45a46d1c7924e98bceeed2ea81b31efcb6f9d/prism.py
+
+        The model and the code are downloaded concurrently. The scorer is loaded right away unless the
+        environment variable `JURY_PRELOAD` is set to a value other than "1", in which case it is loaded on
+        the first computation.
         """
-        self._download_model(dl_manager)
         prism_source = (
             "https://raw.githubusercontent.com/thompsonb/prism/42e45a46d1c7924e98bceeed2ea81b31efcb6f9d/prism.py"
         )
-        self.external_module_path = dl_manager.download(
-            prism_source,
-        )
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            model_future = executor.submit(self._download_model, dl_manager)
+            prism_future = executor.submit(dl_manager.download, prism_source)
+            model_future.result()
+            self.external_module_path = prism_future.result()
+        if os.environ.get("JURY_PRELOAD", "1") == "1":
+            self._load_scorer()
 
     def _info(self):
         return datasets.MetricInfo(
@@ -202,10 +344,149 @@ class PrismForLanguageGeneration(MetricForLanguageGeneration):
             license=_LICENSE,
         )
 
+    def _get_torch_devices(self) -> List:
+        """
+        Returns the devices to run the scorer replicas on, the first of which is the primary device.
+        """
+        import torch
+
+        if self.devices:
+            if torch.cuda.is_available():
+                return [torch.device("cuda", index) for index in self.devices]
+            logger.warning("'devices' is only used if CUDA is available, falling back to 'cpu'.")
+            return [torch.device("cpu")]
+        if self.device is not None:
+            return [torch.device(self.device)]
+        return [torch.device("cuda" if torch.cuda.is_available() else "cpu")]
+
+    def _get_torch_dtype(self):
+        import torch
+
+        if isinstance(self.dtype, str):
+            return getattr(torch, self.dtype)
+        return self.dtype
+
+    @contextmanager
+    def _inference_context(self, device):
+        """
+        Context for running the scorer on the given device, disables autograd and sets the CUDA device and
+        the autocast type if any.
+        """
+        import torch
+
+        with ExitStack() as stack:
+            stack.enter_context(torch.inference_mode())
+            if device.type == "cuda":
+                stack.enter_context(torch.cuda.device(device))
+                if self.dtype is not None:
+                    stack.enter_context(torch.autocast(device_type="cuda", dtype=self._get_torch_dtype()))
+            yield
+
+    def _place_scorer(self, scorer, device) -> None:
+        dtype = None
+        if self.dtype is not None:
+            if device.type == "cuda":
+                dtype = self._get_torch_dtype()
+            else:
+                logger.warning(f"'dtype' is only applied on CUDA devices, keeping float32 on '{device}'.")
+        for model in scorer.models:
+            model.to(device=device, dtype=dtype)
+        # Prism moves the batches to the current CUDA device if `use_cuda` is set.
+        scorer.use_cuda = device.type == "cuda"
+
+    def _compile_scorer(self, scorer, device) -> None:
+        """
+        Compiles forward passes of the scorer's models with `torch.compile` and warms the compiled graph up
+        with a dummy input. Models are restored to eager mode if compilation fails.
+        """
+        import torch
+
+        try:
+            for model in scorer.models:
+                model.forward = torch.compile(model.forward, mode="default", dynamic=True, fullgraph=False)
+            with self._inference_context(device):
+                scorer.score(cand=["a"], ref=["a"], segment_scores=True)
+        except Exception as e:
+            logger.warning(f"Compiling Prism model failed, falling back to eager mode. {e}")
+            for model in scorer.models:
+                model.__dict__.pop("forward", None)
+
+    def _get_pooled_scorer(self, device, jit: bool):
+        pool_key = (self.model_dir, self.lang, self.temperature, jit, str(device), self.dtype)
+        if pool_key not in self._SCORER_POOL:
+            Prism = self._get_external_resource("prism", attr="Prism")
+            scorer = Prism(model_dir=self.model_dir, lang=self.lang, temperature=self.temperature)
+            # SentencePiece encoding is deterministic, so the tokenized sentences can be cached as is.
+            scorer._encode = functools.lru_cache(maxsize=self._TOKENIZATION_CACHE_SIZE)(scorer._encode)
+            self._place_scorer(scorer, device)
+            if jit:
+                self._compile_scorer(scorer, device)
+            self._SCORER_POOL[pool_key] = scorer
+        return self._SCORER_POOL[pool_key]
+
     def _load_scorer(self):
         if self.scorer is None:
-            Prism = self._get_external_resource("prism", attr="Prism")
-            self.scorer = Prism(model_dir=self.model_dir, lang=self.lang, temperature=self.temperature)
+            if njit is not None:
+                _warm_up_kernels()
+            self._replicas = [
+                (self._get_pooled_scorer(device, self.jit), device) for device in self._get_torch_devices()
+            ]
+            self.scorer = self._replicas[0][0]
+
+    def _score_shard(self, pairs: List[Tuple[str, str]], replica_index: int) -> np.ndarray:
+        scorer, device = self._replicas[replica_index]
+        preds, refs = zip(*pairs)
+        with self._inference_context(device):
+            return np.asarray(scorer.score(ref=list(refs), cand=list(preds), segment_scores=True))
+
+    def _score_pairs(self, pairs: List[Tuple[str, str]]) -> np.ndarray:
+        """
+        Returns segment scores of the given (prediction, reference) pairs in the same order. On CUDA, pairs
+        are scored in micro-batches of adaptive size, which is grown on success and halved on out of memory
+        errors. Otherwise, all pairs are passed to the scorer at once, which batches them by its own token
+        budget. With multiple devices, each micro-batch is split into contiguous shards which are scored
+        concurrently by the replica on each device.
+        """
+        n_replicas = len(self._replicas)
+        adaptive = all(device.type == "cuda" for _, device in self._replicas)
+        executor = ThreadPoolExecutor(max_workers=n_replicas) if n_replicas > 1 else None
+        scores = []
+        start = 0
+        try:
+            while start < len(pairs):
+                batch_size = self._batch_size if adaptive else len(pairs)
+                batch = pairs[start : start + batch_size * n_replicas]
+                shard_size = -(-len(batch) // n_replicas)
+                shards = [batch[i : i + shard_size] for i in range(0, len(batch), shard_size)]
+                try:
+                    if executor is None:
+                        batch_scores = [self._score_shard(shards[0], 0)]
+                    else:
+                        batch_scores = list(executor.map(self._score_shard, shards, range(len(shards))))
+                except RuntimeError as e:
+                    if not adaptive or "out of memory" not in str(e) or self._batch_size == 1:
+                        raise
+                    import torch
+
+                    torch.cuda.empty_cache()
+                    self._batch_size = max(1, self._batch_size // 2)
+                    self._successful_batches = 0
+                    logger.warning(f"CUDA out of memory, retrying with batch size {self._batch_size}.")
+                    continue
+
+                scores.extend(batch_scores)
+                start += len(batch)
+                if not adaptive:
+                    continue
+                self._successful_batches += 1
+                if self._successful_batches >= self._BATCH_SIZE_GROWTH_INTERVAL:
+                    grown_batch_size = max(self._batch_size + 1, int(self._batch_size * self._BATCH_SIZE_GROWTH))
+                    self._batch_size = min(self._MAX_BATCH_SIZE, grown_batch_size)
+                    self._successful_batches = 0
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return np.concatenate(scores)
 
     def _compute_prism_score(
         self,
@@ -213,18 +494,88 @@ class PrismForLanguageGeneration(MetricForLanguageGeneration):
         references: LanguageGenerationInstance,
         segment_scores: bool,
         **kwargs,
-    ) -> Union[float, List[float]]:
+    ) -> Union[float, np.ndarray]:
+        """
+        Computes Prism scores of the given (prediction, reference) pairs. Segment scores are cached per pair
+        (least recently used pairs are evicted beyond `_SCORE_CACHE_SIZE`), so that only the pairs which have
+        not been scored recently by this metric are passed to the scorer.
+        """
         self._load_scorer()
-        score = self.scorer.score(ref=references, cand=predictions, segment_scores=segment_scores, **kwargs)
+        if kwargs:
+            # Extra scorer arguments (e.g. source sentences) alter the score, bypass the cache.
+            with self._inference_context(self._replicas[0][1]):
+                score = self.scorer.score(ref=references, cand=predictions, segment_scores=segment_scores, **kwargs)
+            if segment_scores:
+                return np.asarray(score, dtype=np.float64)
+            return float(score)
+
+        pairs = list(zip(predictions, references))
+        # Identical pairs within the call are scored only once.
+        unique_pairs = dict.fromkeys(pairs)
+        pair_scores = {pair: self._score_cache[pair] for pair in unique_pairs if pair in self._score_cache}
+        for pair in pair_scores:
+            self._score_cache.move_to_end(pair)
+        misses = [pair for pair in unique_pairs if pair not in pair_scores]
+        if misses:
+            # Pairs are scored in the order of their lengths, so that batches consist of similar length sentences
+            # and padding is minimized, scores are put back in place by pair.
+            misses.sort(key=lambda pair: len(pair[0]) + len(pair[1]))
+            miss_scores = dict(zip(misses, self._score_pairs(misses).tolist()))
+            pair_scores.update(miss_scores)
+            self._score_cache.update(miss_scores)
+            while len(self._score_cache) > self._SCORE_CACHE_SIZE:
+                self._score_cache.popitem(last=False)
+
+        score = np.fromiter((pair_scores[pair] for pair in pairs), dtype=np.float64, count=len(pairs))
         if segment_scores:
-            return score.tolist()
-        return float(score)
+            return score
+        return float(score.mean())
+
+    @classmethod
+    def _normalize_score(cls, score: Union[float, np.ndarray], exponent: float) -> Union[float, np.ndarray]:
+        score = np.asarray(score, dtype=np.float64)
+        if njit is not None and score.size >= cls._NUMBA_MIN_SIZE:
+            normalized_score = _pow_vec(float(exponent), score)
+        else:
+            normalized_score = np.power(exponent, score)
+        if np.ndim(normalized_score) == 0:
+            return float(normalized_score)
+        return normalized_score
 
-    @staticmethod
-    def _normalize_score(score: Union[float, List[float]], exponent: float):
-        if isinstance(score, float):
-            return exponent ** score
-        return [exponent ** s for s in score]
+    @classmethod
+    def _reduce_groups(cls, scores: np.ndarray, offsets: List[int], reduce_fn: Callable) -> np.ndarray:
+        """
+        Reduces consecutive groups of scores delimited by offsets with reduce_fn. If reduce_fn has a NaN-aware
+        numpy counterpart, groups are padded with NaN into a single (n_groups, max_group_size) array and reduced
+        along its rows at once, otherwise each group is reduced separately. Groups of equal size are reshaped
+        into the array without padding.
+        """
+        nan_reduce_fn = _NAN_REDUCE_FNS.get(reduce_fn)
+        if nan_reduce_fn is None:
+            return np.array([float(reduce_fn(group)) for group in np.split(scores, offsets[1:-1])])
+
+        lengths = np.diff(offsets)
+        max_length = lengths.max()
+        if (lengths == max_length).all():
+            padded_scores = scores.reshape(len(lengths), max_length)
+        else:
+            padded_scores = np.full((len(lengths), max_length), np.nan)
+            padded_scores[np.arange(max_length) < lengths[:, None]] = scores
+        if nan_reduce_fn is np.nanmean and njit is not None and padded_scores.size >= cls._NUMBA_MIN_SIZE:
+            return _nanmean_rows(padded_scores)
+        return nan_reduce_fn(padded_scores, axis=1)
+
+    def evaluate(self, predictions: Collator, references: Collator, **kwargs) -> Dict[str, float]:
+        """
+        Runs the evaluation in `torch.inference_mode()`, so that none of the `_compute_*` paths does autograd
+        bookkeeping. The scorer is loaded beforehand, so that its parameters are regular tensors. Note that
+        inference mode is thread-local, scorer calls on worker threads enter it in `_inference_context`.
+        """
+        import torch
+
+        self._load_scorer()
+        with torch.inference_mode():
+            return super().evaluate(predictions=predictions, references=references, **kwargs)
 
     def _compute_single_pred_single_ref(
         self,
@@ -236,12 +587,13 @@ class PrismForLanguageGeneration(MetricForLanguageGeneration):
         **kwargs,
     ):
         score = self._compute_prism_score(predictions, references, segment_scores=segment_scores, **kwargs)
+        identifier = self.model_identifier
         if normalize:
-            score = self._normalize_score(score, self.model_identifier["log_base"])
+            score = self._normalize_score(score, identifier["log_base"])
 
         return {
-            "score": score,
-            "identifier": self.model_identifier,
+            "score": score.tolist() if segment_scores else score,
+            "identifier": identifier,
             "model_path_or_url": self.model_path_or_url,
             "lang": self.lang,
             "segment_scores": segment_scores,
@@ -257,23 +609,34 @@ class PrismForLanguageGeneration(MetricForLanguageGeneration):
         normalize: bool = False,
         **kwargs,
     ):
-        self._load_scorer()
-        scores = []
-        for pred, refs in zip(predictions, references):
-            pred = [pred] * len(refs)
-            prism_score = self._compute_prism_score(predictions=pred, references=refs, segment_scores=True, **kwargs)
-            reduced_score = float(reduce_fn(prism_score))
-            scores.append(reduced_score)
-
+        ref_counts = {len(refs) for refs in references}
+        if len(ref_counts) == 1:
+            # Each instance has the same number of references, pairs form a regular (N, R) layout.
+            n_refs = ref_counts.pop()
+            flat_preds = np.repeat(np.asarray(predictions, dtype=object), n_refs).tolist()
+            flat_refs = np.asarray(references, dtype=object).ravel().tolist()
+            offsets = list(range(0, len(flat_preds) + 1, n_refs))
+        else:
+            flat_preds, flat_refs, offsets = [], [], [0]
+            for pred, refs in zip(predictions, references):
+                flat_preds.extend([pred] * len(refs))
+                flat_refs.extend(refs)
+                offsets.append(len(flat_preds))
+
+        flat_scores = self._compute_prism_score(
+            predictions=flat_preds, references=flat_refs, segment_scores=True, **kwargs
+        )
+        scores = self._reduce_groups(flat_scores, offsets, reduce_fn)
         if not segment_scores:
-            scores = sum(scores) / len(scores)
+            scores = float(scores.mean())
 
+        identifier = self.model_identifier
         if normalize:
-            scores = self._normalize_score(scores, self.model_identifier["log_base"])
+            scores = self._normalize_score(scores, identifier["log_base"])
 
         return {
-            "score": scores,
-            "identifier": self.model_identifier,
+            "score": scores.tolist() if segment_scores else scores,
+            "identifier": identifier,
             "model_path_or_url": self.model_path_or_url,
             "lang": self.lang,
             "segment_scores": segment_scores,
@@ -289,29 +652,29 @@ class PrismForLanguageGeneration(MetricForLanguageGeneration):
         normalize: bool = False,
         **kwargs,
     ):
-        self._load_scorer()
-        scores = []
+        flat_preds, flat_refs, pred_offsets, instance_offsets = [], [], [0], [0]
         for preds, refs in zip(predictions, references):
-            pred_scores = []
             for pred in preds:
-                pred = [pred] * len(refs)
-                prism_score = self._compute_prism_score(
-                    predictions=pred, references=refs, segment_scores=True, **kwargs
-                )
-                reduced_pred_score = float(reduce_fn(prism_score))
-                pred_scores.append(reduced_pred_score)
-            reduced_score = float(reduce_fn(pred_scores))
-            scores.append(reduced_score)
+                flat_preds.extend([pred] * len(refs))
+                flat_refs.extend(refs)
+                pred_offsets.append(len(flat_preds))
+            instance_offsets.append(len(pred_offsets) - 1)
 
+        flat_scores = self._compute_prism_score(
+            predictions=flat_preds, references=flat_refs, segment_scores=True, **kwargs
+        )
+        pred_scores = self._reduce_groups(flat_scores, pred_offsets, reduce_fn)
+        scores = self._reduce_groups(pred_scores, instance_offsets, reduce_fn)
         if not segment_scores:
-            scores = sum(scores) / len(scores)
+            scores = float(scores.mean())
 
+        identifier = self.model_identifier
         if normalize:
-            scores = self._normalize_score(scores, self.model_identifier["log_base"])
+            scores = self._normalize_score(scores, identifier["log_base"])
 
         return {
-            "score": scores,
-            "identifier": self.model_identifier,
+            "score": scores.tolist() if segment_scores else scores,
+            "identifier": identifier,
             "model_path_or_url": self.model_path_or_url,
             "lang": self.lang,
             "segment_scores": segment_scores,
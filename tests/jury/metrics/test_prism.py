@@ -1,7 +1,13 @@
+import contextlib
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import numpy as np
 import pytest
 
 from jury import Jury
 from jury.metrics import AutoMetric
+from jury.metrics.prism.prism_for_language_generation import PrismForLanguageGeneration
 from tests.jury.conftest import get_expected_output
 from tests.utils import assert_almost_equal_dict
 
@@ -12,6 +18,32 @@ def jury_prism():
     return Jury(metrics=metric)
 
 
+class StubScorer:
+    """Scores a pair by the negative total length of its sentences, raises CUDA OOM for large calls."""
+
+    def __init__(self, oom_above: int = None):
+        self.oom_above = oom_above
+        self.calls = []
+
+    def score(self, cand, ref, segment_scores=False):
+        if self.oom_above is not None and len(cand) > self.oom_above:
+            raise RuntimeError("CUDA out of memory.")
+        self.calls.append(list(zip(cand, ref)))
+        return -np.array([len(c) + len(r) for c, r in zip(cand, ref)], dtype=np.float32)
+
+
+def get_stub_prism(scorer: StubScorer, device_type: str = "cpu") -> PrismForLanguageGeneration:
+    # Bypasses __init__, which downloads and loads the model.
+    prism = PrismForLanguageGeneration.__new__(PrismForLanguageGeneration)
+    prism.scorer = scorer
+    prism._replicas = [(scorer, SimpleNamespace(type=device_type))]
+    prism._score_cache = OrderedDict()
+    prism._batch_size = PrismForLanguageGeneration._INITIAL_BATCH_SIZE
+    prism._successful_batches = 0
+    prism._inference_context = lambda device: contextlib.nullcontext()
+    return prism
+
+
 @pytest.fixture
 @get_expected_output(prefix="metrics")
 def output_basic():
@@ -85,3 +117,66 @@ def test_multiple_pred_multiple_ref_normalized_and_segmented(
 ):
     scores = jury_prism(predictions=predictions, references=references, normalize=True, segment_scores=True)
     assert_almost_equal_dict(actual=scores, desired=output_multiple_pred_multiple_ref_normalized_and_segmented)
+
+
+@pytest.mark.parametrize(
+    "offsets, reduce_fn, expected",
+    [
+        ([0, 2, 5, 6], np.max, [5, 4, 0]),
+        ([0, 2, 5, 6], np.mean, [3, 3, 0]),
+        ([0, 2, 5, 6], lambda x: float(np.max(x)), [5, 4, 0]),
+        ([0, 2, 4, 6], np.mean, [3, 2.5, 2]),
+        ([0, 2, 4, 6], lambda x: float(np.max(x)), [5, 3, 4]),
+    ],
+)
+def test_reduce_groups(offsets, reduce_fn, expected):
+    scores = np.array([1.0, 5.0, 2.0, 3.0, 4.0, 0.0])
+    reduced = PrismForLanguageGeneration._reduce_groups(scores, offsets, reduce_fn)
+    np.testing.assert_allclose(reduced, expected)
+
+
+def test_compute_prism_score_cache_and_dedup():
+    scorer = StubScorer()
+    prism = get_stub_prism(scorer)
+    predictions = ["a long prediction", "b", "a long prediction", "cc"]
+    references = ["ref", "reference", "ref", "r"]
+    expected = [-(len(p) + len(r)) for p, r in zip(predictions, references)]
+
+    scores = prism._compute_prism_score(predictions, references, segment_scores=True)
+    np.testing.assert_allclose(scores, expected)
+    assert len(scorer.calls) == 1
+    assert sorted(scorer.calls[0]) == sorted(set(zip(predictions, references)))
+
+    score = prism._compute_prism_score(predictions[::-1], references[::-1], segment_scores=False)
+    assert score == pytest.approx(np.mean(expected))
+    assert len(scorer.calls) == 1
+
+
+def test_score_pairs_oom_halving():
+    pytest.importorskip("torch")
+    scorer = StubScorer(oom_above=4)
+    prism = get_stub_prism(scorer, device_type="cuda")
+    pairs = [("p" * i, "r") for i in range(20)]
+
+    scores = prism._score_pairs(pairs)
+    np.testing.assert_allclose(scores, [-(i + 1) for i in range(20)])
+    assert prism._batch_size <= 4
+    assert all(len(call) <= 4 for call in scorer.calls)
+
+
+def test_duplicate_devices():
+    with pytest.raises(ValueError):
+        PrismForLanguageGeneration(devices=[0, 0])
+
+
+@pytest.mark.parametrize("cuda_available", [True, False])
+def test_get_torch_devices(monkeypatch, cuda_available):
+    torch = pytest.importorskip("torch")
+    monkeypatch.setattr(torch.cuda, "is_available", lambda: cuda_available)
+    prism = PrismForLanguageGeneration.__new__(PrismForLanguageGeneration)
+    prism.device = "cpu"
+    prism.devices = [1]
+    expected = [torch.device("cuda", 1)] if cuda_available else [torch.device("cpu")]
+    assert prism._get_torch_devices() == expected
+    prism.devices = None
+    assert prism._get_torch_devices() == [torch.device("cpu")]
@@ -1,7 +1,13 @@
+import hashlib
+import io
+import os
+import tarfile
+
 import numpy as np
 import pytest
 
-from jury.metrics._core.utils import is_reduce_fn
+from jury.metrics._core import utils
+from jury.metrics._core.utils import download_and_extract_tar, is_reduce_fn
 from jury.utils.common import bulk_remove_keys
 from jury.utils.nlp import normalize_text
 
@@ -30,3 +36,110 @@ def test_bulk_remove_keys():
 def test_is_reduce_fn():
     assert not is_reduce_fn(np.exp)
     assert is_reduce_fn(np.mean)
+
+
+class _FakeStreamResponse:
+    def __init__(self, content: bytes):
+        self.raw = io.BytesIO(content)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def tar_content():
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        data = b"model weights"
+        info = tarfile.TarInfo(name="model/checkpoint.pt")
+        info.size = len(data)
+        tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def mock_requests_get(monkeypatch, tar_content):
+    calls = []
+
+    def fake_get(*args, **kwargs):
+        calls.append(kwargs)
+        return _FakeStreamResponse(tar_content)
+
+    monkeypatch.setattr(utils.requests, "get", fake_get)
+    return calls
+
+
+def test_download_and_extract_tar(tmp_path, tar_content, mock_requests_get):
+    destination = str(tmp_path / "extracted")
+    download_and_extract_tar(
+        "https://example.com/model.tar", destination, sha256=hashlib.sha256(tar_content).hexdigest(), timeout=5
+    )
+    with open(os.path.join(destination, "model", "checkpoint.pt"), "rb") as f:
+        assert f.read() == b"model weights"
+    assert mock_requests_get[0]["timeout"] == 5
+    assert not os.path.exists(destination + ".incomplete")
+
+
+def test_download_and_extract_tar_existing_destination(tmp_path, mock_requests_get):
+    destination = tmp_path / "extracted"
+    destination.mkdir()
+    download_and_extract_tar("https://example.com/model.tar", str(destination))
+    assert mock_requests_get == []
+    assert os.listdir(destination) == []
+
+
+def test_download_and_extract_tar_checksum_mismatch(tmp_path, mock_requests_get):
+    destination = str(tmp_path / "extracted")
+    with pytest.raises(ValueError):
+        download_and_extract_tar("https://example.com/model.tar", destination, sha256="0" * 64)
+    assert not os.path.exists(destination)
+    assert not os.path.exists(destination + ".incomplete")
+
+
+@pytest.mark.parametrize("has_data_filter", [True, False])
+def test_download_and_extract_tar_unsafe_members(monkeypatch, tmp_path, has_data_filter):
+    if not has_data_filter:
+        monkeypatch.delattr(tarfile, "data_filter", raising=False)
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        for name in ["../evil", "model/checkpoint.pt"]:
+            info = tarfile.TarInfo(name=name)
+            info.size = len(b"data")
+            tar.addfile(info, io.BytesIO(b"data"))
+        link = tarfile.TarInfo(name="model/link")
+        link.type = tarfile.SYMTYPE
+        link.linkname = "../../evil_link"
+        tar.addfile(link)
+    monkeypatch.setattr(utils.requests, "get", lambda *args, **kwargs: _FakeStreamResponse(buffer.getvalue()))
+
+    destination = tmp_path / "models" / "extracted"
+    with pytest.warns(UserWarning):
+        download_and_extract_tar("https://example.com/model.tar", str(destination))
+    assert (destination / "model" / "checkpoint.pt").exists()
+    assert not os.path.lexists(destination / "model" / "link")
+    assert not (tmp_path / "models" / "evil").exists()
+
+
+def test_download_and_extract_tar_extracted_while_waiting_for_lock(monkeypatch, tmp_path, mock_requests_get):
+    destination = tmp_path / "extracted"
+
+    class _ConcurrentlyExtractedLock:
+        def __init__(self, lock_file):
+            assert lock_file == str(destination) + ".lock"
+
+        def __enter__(self):
+            destination.mkdir()
+
+        def __exit__(self, *args):
+            pass
+
+    monkeypatch.setattr(utils, "FileLock", _ConcurrentlyExtractedLock)
+    download_and_extract_tar("https://example.com/model.tar", str(destination))
+    assert mock_requests_get == []
+    assert os.listdir(destination) == []